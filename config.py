@@ -1,24 +1,44 @@
 # Configuration for ITviec Crawler
 # This file contains settings that can be easily modified
 
+from dataclasses import dataclass
+from types import MappingProxyType
+
 # Crawler settings
-CRAWLER_CONFIG = {
-    "base_url": "https://itviec.com",
-    "default_delay": 1.0,  # seconds between requests
-    "max_retries": 3,
-    "timeout": 10,  # seconds
-    "default_pages": 3,
-}
+@dataclass(frozen=True, slots=True)
+class CrawlerConfig:
+    base_url: str = "https://itviec.com"
+    default_delay: float = 1.0  # seconds between requests
+    requests_per_minute: int = 60  # token-bucket rate for each crawler
+    max_retries: int = 3
+    backoff_factor: float = 0.5  # retry sleeps 0.5s, 1s, 2s... unless Retry-After says otherwise
+    timeout: float = 10  # seconds
+    max_page_bytes: int = 2_000_000  # larger response bodies are truncated
+    default_pages: int = 3
+    cache_path: str = "outputs/http_cache.sqlite"  # on-disk HTTP response cache
+    cache_ttl: int = 600  # seconds a cached response is kept
+    etag_path: str = "outputs/{site}_etags.json"  # page validators for incremental crawls, one file per site
+
+
+CRAWLER_CONFIG = CrawlerConfig()
 
 # Request headers
-DEFAULT_HEADERS = {
+# Advertise Brotli only when a decoder is installed; httpx needs it to decode 'br'
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+# Read-only view shared by every client
+DEFAULT_HEADERS = MappingProxyType({
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
     'Accept-Language': 'en-US,en;q=0.5',
-    'Accept-Encoding': 'gzip, deflate',
-    'Connection': 'keep-alive',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    # No 'Connection' header: it is connection-specific and forbidden in HTTP/2
     'Upgrade-Insecure-Requests': '1',
-}
+})
 
 # Output settings
 OUTPUT_CONFIG = {
@@ -35,24 +55,36 @@ MONGODB_CONFIG = {
 }
 
 # Site-specific configurations (for Phase 2)
+@dataclass(frozen=True, slots=True)
+class SiteConfig:
+    name: str
+    base_url: str
+    jobs_path: str
+    rate_limit: float  # seconds between requests
+    parser_class: str  # name of the parser class exported by parsers/
+
+
 SITE_CONFIGS = {
-    "itviec": {
-        "base_url": "https://itviec.com",
-        "jobs_path": "/it-jobs",
-        "rate_limit": 1.0,  # seconds between requests
-        "parser_class": "ITviecParser",
-    },
+    "itviec": SiteConfig(
+        name="itviec",
+        base_url="https://itviec.com",
+        jobs_path="/it-jobs",
+        rate_limit=1.0,
+        parser_class="ITviecParser",
+    ),
     # Future sites can be added here
-    "topdev": {
-        "base_url": "https://topdev.vn", 
-        "jobs_path": "/it-jobs",
-        "rate_limit": 1.5,
-        "parser_class": "TopDevParser",  # To be implemented in Phase 2
-    },
-    "vietnamworks": {
-        "base_url": "https://vietnamworks.com",
-        "jobs_path": "/tim-viec-lam",
-        "rate_limit": 2.0,
-        "parser_class": "VietnamWorksParser",  # To be implemented in Phase 2
-    }
+    "topdev": SiteConfig(
+        name="topdev",
+        base_url="https://topdev.vn",
+        jobs_path="/it-jobs",
+        rate_limit=1.5,
+        parser_class="TopDevParser",  # To be implemented in Phase 2
+    ),
+    "vietnamworks": SiteConfig(
+        name="vietnamworks",
+        base_url="https://vietnamworks.com",
+        jobs_path="/tim-viec-lam",
+        rate_limit=2.0,
+        parser_class="VietnamWorksParser",  # To be implemented in Phase 2
+    ),
 }
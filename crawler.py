@@ -1,20 +1,40 @@
 #!/usr/bin/env python3
 """
 SpiderJobs Distributed Crawler - Phase 1: ITviec Crawler
-Main crawler script for ITviec.com job listings
+Main crawler script for ITviec.com job listings, plus a multi-site scheduler
+driven by SITE_CONFIGS
 """
 
+import asyncio
+import contextlib
 import csv
+import hashlib
+import json
+import os
+import pickle
+import random
+import sys
 import time
 import logging
-from typing import List, Optional
-from dataclasses import dataclass, asdict
-from urllib.parse import urljoin, urlparse
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from concurrent.futures import Executor, ProcessPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import replace
+from urllib.parse import urlencode, urljoin, urlparse
+import anysqlite
+import hishel
+import httpx
+import orjson
+from aiolimiter import AsyncLimiter
 
-from parsers.itviec import ITviecParser
+try:
+    from pymongo import MongoClient, UpdateOne
+except ImportError:  # MongoDB storage is optional
+    MongoClient = UpdateOne = None
+
+from config import CRAWLER_CONFIG, DEFAULT_HEADERS, MONGODB_CONFIG, OUTPUT_CONFIG, SITE_CONFIGS, SiteConfig
+from models import JobBatch, JobListing  # re-exported: `from crawler import JobListing` keeps working
+import parsers
 
 # Configure logging
 logging.basicConfig(
@@ -24,172 +44,727 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class JobListing:
-    """Data class for job listing information"""
-    title: str
-    link: str
-    company: str
-    location: str
-    posted_date: str
-    logo_url: str
-    skills: List[str] = None
+# Returned by BaseCrawler._fetch when the server reports the page unchanged
+NOT_MODIFIED = object()
+
+CSV_FIELDNAMES = ['title', 'link', 'company', 'location', 'posted_date', 'logo_url', 'skills']
+
+
+def _rowgen(jobs):
+    """Yield CSV rows as plain tuples in CSV_FIELDNAMES order"""
+    if isinstance(jobs, JobBatch):
+        yield from jobs.rows()
+        return
+    for job in jobs:
+        # Convert skills list to comma-separated string
+        yield (job.title, job.link, job.company, job.location, job.posted_date,
+               job.logo_url, ', '.join(job.skills))
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    """Convert a Retry-After header (seconds or HTTP date) to seconds to wait"""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _RateLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport that spaces out network requests with a per-host token bucket
+    
+    Rate-limit headers from the server (Retry-After, X-RateLimit-Remaining,
+    X-RateLimit-Reset) pause further requests to that host until the
+    advertised budget is available again.
+    """
     
-    def __post_init__(self):
-        if self.skills is None:
-            self.skills = []
+    def __init__(self, transport: httpx.AsyncBaseTransport, host_delays: Dict[str, float],
+                 default_delay: float, jitter: float = 0.0):
+        self.transport = transport
+        self.host_delays = host_delays  # Seconds between requests per host
+        self.default_delay = default_delay
+        self.jitter = jitter  # Upper bound of the random pause, as a fraction of the delay
+        self.limiters: Dict[str, Optional[AsyncLimiter]] = {}
+        self.blocked_until: Dict[str, float] = {}  # Host -> time.time() when requests may resume
+    
+    def _limiter_for(self, host: str) -> Optional[AsyncLimiter]:
+        """Token bucket for the host, or None when its delay is 0 (unthrottled)"""
+        if host not in self.limiters:
+            delay = self.host_delays.get(host, self.default_delay)
+            self.limiters[host] = AsyncLimiter(1, delay) if delay > 0 else None
+        return self.limiters[host]
+    
+    def _update_budget(self, host: str, headers: httpx.Headers):
+        """Record when the host allows the next request, based on its headers"""
+        wait = None
+        if "Retry-After" in headers:
+            wait = _parse_retry_after(headers["Retry-After"])
+        elif headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in headers:
+            try:
+                reset = float(headers["X-RateLimit-Reset"])
+            except ValueError:
+                reset = None
+            if reset is not None:
+                # Servers send either an epoch timestamp or a delta in seconds
+                wait = max(0.0, reset - time.time()) if reset > 1e9 else reset
+        
+        if wait:
+            self.blocked_until[host] = max(self.blocked_until.get(host, 0.0), time.time() + wait)
+            logger.warning("Rate limited by %s, pausing for %.1fs", host, wait)
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        limiter = self._limiter_for(host)
+        if limiter is not None and self.jitter:
+            await asyncio.sleep(random.uniform(0, self.jitter * limiter.time_period))
+        
+        # Server-advertised pauses still apply to unthrottled hosts
+        async with limiter if limiter is not None else contextlib.nullcontext():
+            wait = self.blocked_until.get(host, 0.0) - time.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            response = await self.transport.handle_async_request(request)
+        
+        self._update_budget(host, response.headers)
+        return response
+    
+    async def aclose(self):
+        await self.transport.aclose()
 
 
-class ITviecCrawler:
-    """Main crawler class for ITviec.com"""
+class BaseCrawler:
+    """Site-agnostic crawler configured by a SiteConfig"""
     
-    def __init__(self, base_url: str = "https://itviec.com", delay: float = 1.0):
-        self.base_url = base_url
-        self.delay = delay  # Politeness delay between requests
-        self.parser = ITviecParser()
-        
-        # Setup session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+    def __init__(self, site_config: SiteConfig,
+                 delay: Optional[float] = None,
+                 cache_path: Optional[str] = CRAWLER_CONFIG.cache_path,
+                 etag_path: Optional[str] = CRAWLER_CONFIG.etag_path):
+        site = site_config.name
+        parser_class = getattr(parsers, site_config.parser_class, None)
+        if parser_class is None:
+            raise ValueError(f"Parser {site_config.parser_class} for site '{site}' is not implemented")
+        
+        self.site = site
+        self.base_url = site_config.base_url
+        self.jobs_path = site_config.jobs_path
+        # Politeness delay between requests, the site's rate_limit by default
+        self.delay = site_config.rate_limit if delay is None else delay
+        # Each parser module exposes a picklable parse_jobs(html, base_url)
+        # that worker processes call with a parser cached per process
+        self.parse_page = sys.modules[parser_class.__module__].parse_jobs
+        
+        # Checkpoint files used by crawl_jobs_async(resume=True); crawls with
+        # a query get their own pair, see _checkpoint_paths
+        outputs_dir = OUTPUT_CONFIG["outputs_dir"]
+        self.progress_path = os.path.join(outputs_dir, f"{site}_progress.json")
+        self.checkpoint_csv = os.path.join(outputs_dir, f"{site}.csv")
+        self.cache_path = cache_path  # On-disk HTTP cache, None to disable
+        # Per-page ETag/Last-Modified sidecar, None to disable. A {site}
+        # placeholder keeps each site's validators in its own file.
+        self.etag_path = etag_path.format(site=site) if etag_path else None
+        
+        # HTTP/2 client, created lazily inside the running event loop so all
+        # page fetches are multiplexed over a single connection per host
+        self.client: Optional[httpx.AsyncClient] = None
+        self.max_retries = CRAWLER_CONFIG.max_retries
+        self.backoff_factor = CRAWLER_CONFIG.backoff_factor
+        self.max_page_bytes = CRAWLER_CONFIG.max_page_bytes
+        self.retry_statuses = {429, 500, 502, 503, 504}
+    
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """Create the shared HTTP/2 client with browser-like headers"""
+        if self.client is not None:
+            return self.client
+        
+        # Pool sized for concurrent fetches so every in-flight request reuses a
+        # persistent connection; `retries` re-attempts failed connects
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=85),
+            retries=self.max_retries,
+        )
+        
+        # Token buckets allowing one request per host every `rate_limit`
+        # seconds (our own `delay` for base_url), plus jitter. They sit
+        # below the cache so cache hits are not throttled.
+        host_delays = {urlparse(cfg.base_url).hostname: cfg.rate_limit for cfg in SITE_CONFIGS.values()}
+        host_delays[urlparse(self.base_url).hostname] = self.delay
+        transport = _RateLimitedTransport(transport, host_delays, self.delay, jitter=0.3)
+        
+        # Wrap the transport with a SQLite-backed cache that honours
+        # Cache-Control and revalidates stale entries with ETag/Last-Modified
+        if self.cache_path:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            connection = await anysqlite.connect(self.cache_path, check_same_thread=False)
+            transport = hishel.AsyncCacheTransport(
+                transport=transport,
+                storage=hishel.AsyncSQLiteStorage(connection=connection, ttl=CRAWLER_CONFIG.cache_ttl),
+                controller=hishel.Controller(allow_stale=True),
+            )
+        
+        self.client = httpx.AsyncClient(
+            transport=transport,
+            headers=DEFAULT_HEADERS,
+            timeout=CRAWLER_CONFIG.timeout,
+            follow_redirects=True,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
-        # Headers to appear more like a real browser
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
-    
-    def fetch_page(self, url: str) -> Optional[str]:
+        return self.client
+    
+    async def fetch_page(self, url: str) -> Optional[str]:
         """Fetch HTML content from a URL with error handling"""
+        html_content, _ = await self._fetch(url)
+        return html_content
+    
+    async def _fetch(self, url: str, validators: Optional[Dict[str, str]] = None) -> Tuple[object, Dict[str, str]]:
+        """
+        Fetch a page, optionally as a conditional request
+        
+        Args:
+            url: Page URL
+            validators: ETag/Last-Modified stored from a previous crawl
+            
+        Returns:
+            (HTML content, None on failure or NOT_MODIFIED, the response's validators)
+        """
+        client = await self._ensure_client()
+        headers = {}
+        if validators:
+            if "etag" in validators:
+                headers["If-None-Match"] = validators["etag"]
+            if "last_modified" in validators:
+                headers["If-Modified-Since"] = validators["last_modified"]
+        
+        try:
+            logger.info("Fetching: %s", url)
+            for attempt in range(self.max_retries + 1):
+                async with client.stream("GET", url, headers=headers) as response:
+                    if response.status_code not in self.retry_statuses or attempt == self.max_retries:
+                        new_validators = {}
+                        if "ETag" in response.headers:
+                            new_validators["etag"] = response.headers["ETag"]
+                        if "Last-Modified" in response.headers:
+                            new_validators["last_modified"] = response.headers["Last-Modified"]
+                        
+                        # A 304, or a (cached) 200 carrying the validator we
+                        # already hold, means the page has not changed
+                        if response.status_code == 304 or (validators and new_validators == validators):
+                            logger.info("Not modified: %s", url)
+                            return NOT_MODIFIED, validators
+                        
+                        response.raise_for_status()
+                        if response.extensions.get("from_cache"):
+                            logger.info("Cache hit: %s", url)
+                        return await self._read_html(response, url), new_validators
+                    retry_after = "Retry-After" in response.headers
+                
+                # Exponential backoff before retrying a throttled/failed request,
+                # unless the server told the transport how long to wait
+                if not retry_after:
+                    await asyncio.sleep(self.backoff_factor * 2 ** attempt)
+        except httpx.HTTPError as e:
+            logger.error("Error fetching %s: %s", url, e)
+            return None, {}
+    
+    async def _read_html(self, response: httpx.Response, url: str) -> Optional[str]:
+        """Read a streamed HTML body, rejecting non-HTML and capping its size"""
+        content_type = response.headers.get("Content-Type", "")
+        if content_type and "html" not in content_type:
+            logger.warning("Skipping non-HTML response from %s: %s", url, content_type)
+            return None
+        
+        body = bytearray()
+        async for chunk in response.aiter_bytes(chunk_size=64 * 1024):
+            body += chunk
+            if len(body) > self.max_page_bytes:
+                logger.warning("Response from %s exceeds %d bytes, truncating", url, self.max_page_bytes)
+                del body[self.max_page_bytes:]
+                break
+        
+        return body.decode(response.encoding or "utf-8", errors="replace")
+    
+    async def aclose(self):
+        """Close the underlying HTTP client"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+    
+    def _page_cache_file(self, url: str) -> str:
+        """Path of the pickled parse results for a page URL"""
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(os.path.dirname(self.etag_path), "page_cache", f"{digest}.pkl")
+    
+    def _load_page_cache(self, url: str) -> Optional[JobBatch]:
+        """Load parse results stored for an unchanged page"""
         try:
-            logger.info(f"Fetching: {url}")
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            return response.text
-        except requests.RequestException as e:
-            logger.error(f"Error fetching {url}: {e}")
+            with open(self._page_cache_file(url), "rb") as f:
+                jobs = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            logger.warning("No usable cached results for %s: %s", url, e)
             return None
+        # Entries written before pages were batched hold JobListing lists
+        return jobs if isinstance(jobs, JobBatch) else None
+    
+    def _save_page_cache(self, url: str, jobs: JobBatch):
+        """Store parse results so an unchanged page can skip fetching and parsing"""
+        filename = self._page_cache_file(url)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, "wb") as f:
+            pickle.dump(jobs, f, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    def _load_etags(self) -> Dict[str, Dict[str, str]]:
+        """Load page validators saved by the previous crawl"""
+        if not self.etag_path:
+            return {}
+        try:
+            with open(self.etag_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_etags(self, etags: Dict[str, Dict[str, str]]):
+        """Persist page validators for the next crawl"""
+        os.makedirs(os.path.dirname(self.etag_path), exist_ok=True)
+        tmp_path = f"{self.etag_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(etags, f, indent=2)
+        os.replace(tmp_path, self.etag_path)
+    
+    def _checkpoint_paths(self, query: str) -> Tuple[str, str]:
+        """Progress file and checkpoint CSV for a query, so crawls for different queries never share them"""
+        if not query:
+            return self.progress_path, self.checkpoint_csv
+        tag = hashlib.sha1(query.encode("utf-8")).hexdigest()[:8]
+        progress_root, progress_ext = os.path.splitext(self.progress_path)
+        csv_root, csv_ext = os.path.splitext(self.checkpoint_csv)
+        return f"{progress_root}_{tag}{progress_ext}", f"{csv_root}_{tag}{csv_ext}"
+    
+    def _load_progress(self, progress_path: str) -> Dict[str, float]:
+        """Load the pages completed by an interrupted crawl (page URL -> timestamp)"""
+        try:
+            with open(progress_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
     
-    def crawl_jobs(self, max_pages: int = 3, query: str = "") -> List[JobListing]:
+    def _save_progress(self, progress: Dict[str, float], progress_path: str):
+        """Persist the pages completed so far, removing the file once none are left"""
+        if not progress:
+            if os.path.exists(progress_path):
+                os.remove(progress_path)
+            return
+        tmp_path = f"{progress_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(progress, f)
+        os.replace(tmp_path, progress_path)
+    
+    async def _write_rows(self, queue: asyncio.Queue, filename: str, append: bool,
+                          pages: List[int],
+                          progress: Optional[Dict[str, float]] = None,
+                          progress_path: Optional[str] = None,
+                          batch_size: int = 100, flush_interval: float = 1.0) -> int:
         """
-        Crawl job listings from ITviec
+        Single consumer writing queued pages to CSV in page order
+        
+        Pages arrive as (page_num, url, jobs) in completion order and are
+        buffered until every earlier page in `pages` is in, so the file
+        follows the same rule as crawl_jobs_async's results: failed (None)
+        pages are skipped and nothing from the first empty page on is
+        written. Rows are written in batches of `batch_size` jobs or every
+        `flush_interval` seconds. When `progress` is given, a page is marked
+        complete in `progress_path` only once its rows are on disk. A None
+        item stops the writer.
+        
+        Returns:
+            Number of rows written
+        """
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        seen = set()
+        if append and os.path.exists(filename):
+            # Links checkpointed by an earlier run stay unique in the file
+            with open(filename, newline='', encoding='utf-8') as csvfile:
+                seen.update(row['link'] for row in csv.DictReader(csvfile))
+        batch = JobBatch()
+        done_urls = []
+        written = 0
+        buffered = {}
+        order = iter(pages)
+        next_page = next(order, None)
+        ended = False
+        
+        with open(filename, 'a' if append else 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            if csvfile.tell() == 0:
+                writer.writerow(CSV_FIELDNAMES)
+            
+            stop = False
+            while not stop:
+                timed_out = False
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=flush_interval)
+                except asyncio.TimeoutError:
+                    item, timed_out = (), True
+                
+                if item is None:
+                    stop = True
+                elif item:
+                    page_num, url, jobs = item
+                    buffered[page_num] = (url, jobs)
+                    while next_page in buffered:
+                        url, jobs = buffered.pop(next_page)
+                        next_page = next(order, None)
+                        if jobs is None:
+                            continue  # Failed page, left for a resumed crawl
+                        # Pages past the first empty one are complete with no rows
+                        ended = ended or not jobs
+                        if not ended:
+                            batch.extend(jobs, seen)
+                        done_urls.append(url)
+                
+                if done_urls and (stop or timed_out or len(batch) >= batch_size):
+                    writer.writerows(batch.rows())
+                    written += len(batch)
+                    csvfile.flush()
+                    if progress is not None:
+                        for url in done_urls:
+                            progress[url] = time.time()
+                        self._save_progress(progress, progress_path)
+                    batch.clear()
+                    done_urls.clear()
+        
+        return written
+    
+    async def crawl_jobs_async(self, max_pages: int = 3, query: str = "",
+                               concurrency: int = 5,
+                               executor: Optional[Executor] = None,
+                               resume: bool = False,
+                               output: Optional[str] = None,
+                               collect: bool = True) -> JobBatch:
+        """
+        Crawl job listings from the site, fetching pages concurrently
         
         Args:
             max_pages: Maximum number of pages to crawl
             query: Search query (optional)
+            concurrency: Maximum number of pages in flight at once
+            executor: Process pool to parse in (optional, one is created per crawl otherwise)
+            resume: Checkpoint each page and skip pages completed by a
+                previous, interrupted crawl with the same query (rows go
+                to `output`, or outputs/<site>.csv by default, with a
+                suffix per query)
+            output: CSV file to stream rows to as pages are parsed (optional)
+            collect: Keep and return the parsed jobs; pass False with `output`
+                to crawl in constant memory
             
         Returns:
-            List of JobListing objects
+            JobBatch of the crawled jobs (pages skipped on resume are not included)
         """
-        all_jobs = []
-        base_jobs_url = f"{self.base_url}/it-jobs"
-        
-        for page_num in range(1, max_pages + 1):
-            # Construct URL for current page
-            if page_num == 1:
-                url = f"{base_jobs_url}?query={query}" if query else base_jobs_url
-            else:
-                url = f"{base_jobs_url}?page={page_num}&query={query}"
+        # Page 1 is the bare listing URL; the query is percent-encoded so
+        # spaces and Vietnamese characters survive
+        base_jobs_url = f"{self.base_url}{self.jobs_path}"
+        first_url = f"{base_jobs_url}?{urlencode({'query': query})}" if query else base_jobs_url
+        urls = [
+            first_url if page_num == 1 else f"{base_jobs_url}?{urlencode({'page': page_num, 'query': query})}"
+            for page_num in range(1, max_pages + 1)
+        ]
+        
+        # The semaphore bounds in-flight requests; request pacing is left to
+        # the client's rate limiter
+        sem = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+        await self._ensure_client()
+        etags = self._load_etags()
+        results = {}
+        failed = False
+        
+        progress_path, checkpoint_csv = self._checkpoint_paths(query)
+        progress = self._load_progress(progress_path) if resume else {}
+        pending = [(page_num, url) for page_num, url in enumerate(urls, 1) if url not in progress]
+        resuming = len(pending) < len(urls)
+        if resuming:
+            logger.info("Resuming: %d pages already completed", len(urls) - len(pending))
+        
+        # Parsed pages are handed to a single writer task through a bounded
+        # queue, so CSV output overlaps with fetching and parsing
+        if resume and output is None:
+            output = checkpoint_csv
+        queue = asyncio.Queue(maxsize=64) if output else None
+        writer_task = None
+        written = 0
+        if queue is not None:
+            # A fresh crawl overwrites the file; a resumed one appends to it
+            writer_task = asyncio.create_task(
+                self._write_rows(queue, output, append=resuming,
+                                 pages=[page_num for page_num, _ in pending],
+                                 progress=progress if resume else None,
+                                 progress_path=progress_path)
+            )
+        
+        async def hand_off(item):
+            """Queue an item for the writer, raising the writer's error if it has died"""
+            put = asyncio.ensure_future(queue.put(item))
+            await asyncio.wait({put, writer_task}, return_when=asyncio.FIRST_COMPLETED)
+            if not put.done():
+                # Nothing drains the queue any more, so a full one would block forever
+                put.cancel()
+                writer_task.result()
+                raise RuntimeError("CSV writer stopped early")
+        
+        async def crawl_page(page_num: int, url: str):
+            async with sem:
+                html_content, validators = await self._fetch(url, etags.get(url))
+            
+            # Unchanged page: reuse the results parsed on a previous run
+            if html_content is NOT_MODIFIED:
+                jobs_on_page = self._load_page_cache(url)
+                if jobs_on_page is not None:
+                    logger.info("Page %d: Reused %d jobs", page_num, len(jobs_on_page))
+                    return page_num, jobs_on_page
+                async with sem:
+                    html_content, validators = await self._fetch(url)
             
-            # Fetch page content
-            html_content = self.fetch_page(url)
             if not html_content:
-                logger.warning(f"Failed to fetch page {page_num}, skipping...")
-                continue
+                logger.warning("Failed to fetch page %d, skipping...", page_num)
+                return page_num, None
             
             # Parse jobs from current page
             try:
-                jobs_on_page = self.parser.parse_jobs(html_content, self.base_url)
-                all_jobs.extend(jobs_on_page)
-                logger.info(f"Page {page_num}: Found {len(jobs_on_page)} jobs")
-                
-                # If no jobs found, we might have reached the end
-                if not jobs_on_page:
-                    logger.info(f"No jobs found on page {page_num}, stopping...")
-                    break
-                    
+                jobs_on_page = await loop.run_in_executor(
+                    executor, self.parse_page, html_content, self.base_url
+                )
             except Exception as e:
-                logger.error(f"Error parsing page {page_num}: {e}")
+                logger.error("Error parsing page %d: %s", page_num, e)
+                return page_num, None
+            
+            logger.info("Page %d: Found %d jobs", page_num, len(jobs_on_page))
+            if self.etag_path and validators:
+                self._save_page_cache(url, jobs_on_page)
+                etags[url] = validators
+            return page_num, jobs_on_page
+        
+        # Parsing is CPU-bound, so it runs in worker processes while other
+        # pages are still being fetched
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        try:
+            tasks = [crawl_page(page_num, url) for page_num, url in pending]
+            for next_page in asyncio.as_completed(tasks):
+                page_num, jobs_on_page = await next_page
+                failed = failed or jobs_on_page is None
+                if collect:
+                    results[page_num] = jobs_on_page
+                if queue is not None:
+                    # Failed pages are queued too so the writer can move past them
+                    await hand_off((page_num, urls[page_num - 1], jobs_on_page))
+        finally:
+            if own_executor:
+                executor.shutdown()
+            if writer_task is not None:
+                if not writer_task.done():
+                    await hand_off(None)
+                written = await writer_task
+        
+        if self.etag_path:
+            self._save_etags(etags)
+        
+        # Assemble in page order so results stay deterministic. Listings
+        # repeated across page boundaries are dropped by link.
+        all_jobs = JobBatch()
+        seen = set()
+        for page_num in range(1, len(urls) + 1):
+            if page_num not in results:
+                continue  # Completed by an earlier run, or not collected
+            jobs_on_page = results[page_num]
+            if jobs_on_page is None:
                 continue
             
-            # Politeness delay
-            if page_num < max_pages:
-                time.sleep(self.delay)
+            # If no jobs found, we might have reached the end
+            if not jobs_on_page:
+                logger.info("No jobs found on page %d, stopping...", page_num)
+                break
+            
+            all_jobs.extend(jobs_on_page, seen)
+        
+        # Every page made it into the CSV, so the next resume starts over.
+        # Only this crawl's pages are dropped; entries left by a crawl with
+        # more pages stay until that one completes.
+        if resume and not failed:
+            for url in urls:
+                progress.pop(url, None)
+            self._save_progress(progress, progress_path)
         
-        logger.info(f"Total jobs crawled: {len(all_jobs)}")
+        logger.info("Total jobs crawled: %d", len(all_jobs) if collect else written)
         return all_jobs
     
-    def save_to_csv(self, jobs: List[JobListing], filename: str = "outputs/itviec_jobs.csv"):
+    def crawl_jobs(self, max_pages: int = 3, query: str = "", resume: bool = False,
+                   output: Optional[str] = None, collect: bool = True) -> JobBatch:
+        """
+        Crawl job listings from the site
+        
+        Synchronous wrapper around crawl_jobs_async.
+        
+        Args:
+            max_pages: Maximum number of pages to crawl
+            query: Search query (optional)
+            resume: Checkpoint pages and skip those completed by an interrupted crawl
+            output: CSV file to stream rows to as pages are parsed (optional)
+            collect: Keep and return the parsed jobs
+            
+        Returns:
+            JobBatch of the crawled jobs
+        """
+        async def run() -> JobBatch:
+            try:
+                return await self.crawl_jobs_async(max_pages=max_pages, query=query,
+                                                   resume=resume, output=output,
+                                                   collect=collect)
+            finally:
+                # The client is bound to this event loop, so close it here
+                await self.aclose()
+        
+        return asyncio.run(run())
+    
+    def save_to_csv(self, jobs: Union[JobBatch, List[JobListing]], filename: str = "outputs/itviec_jobs.csv"):
         """Save job listings to CSV file"""
         if not jobs:
             logger.warning("No jobs to save")
             return
         
         # Ensure outputs directory exists
-        import os
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['title', 'link', 'company', 'location', 'posted_date', 'logo_url', 'skills']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for job in jobs:
-                    job_dict = asdict(job)
-                    # Convert skills list to comma-separated string
-                    job_dict['skills'] = ', '.join(job.skills) if job.skills else ''
-                    writer.writerow(job_dict)
+                writer = csv.writer(csvfile)
+                writer.writerow(CSV_FIELDNAMES)
+                writer.writerows(_rowgen(jobs))
             
-            logger.info(f"Saved {len(jobs)} jobs to {filename}")
+            logger.info("Saved %d jobs to %s", len(jobs), filename)
         except Exception as e:
-            logger.error(f"Error saving to CSV: {e}")
+            logger.error("Error saving to CSV: %s", e)
     
-    def save_to_mongodb(self, jobs: List[JobListing], 
-                       connection_string: str = "mongodb://localhost:27017/",
-                       database: str = "spiderjobs", 
-                       collection: str = "jobs"):
+    def save_to_jsonl(self, jobs: Union[JobBatch, List[JobListing]], filename: str = "outputs/itviec_jobs.jsonl"):
         """
-        Save job listings to MongoDB (optional - requires pymongo)
+        Append job listings to a newline-delimited JSON file
         
-        This method is commented out as MongoDB might not be available in all environments.
-        Uncomment and install pymongo if you want to use MongoDB storage.
+        One JSON document per line, ready for `mongoimport` or streaming readers.
         """
+        if not jobs:
+            logger.warning("No jobs to save")
+            return
+        
+        # Ensure outputs directory exists
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        
         try:
-            # Uncomment the following lines if you have pymongo installed
-            # from pymongo import MongoClient
-            # 
-            # client = MongoClient(connection_string)
-            # db = client[database]
-            # coll = db[collection]
-            # 
-            # # Convert jobs to dictionaries
-            # job_dicts = [asdict(job) for job in jobs]
-            # 
-            # # Insert jobs (replace existing based on link as unique identifier)
-            # for job_dict in job_dicts:
-            #     coll.replace_one(
-            #         {"link": job_dict["link"]}, 
-            #         job_dict, 
-            #         upsert=True
-            #     )
-            # 
-            # logger.info(f"Saved {len(jobs)} jobs to MongoDB: {database}.{collection}")
+            with open(filename, 'ab') as jsonlfile:
+                # orjson serializes dataclasses natively, no asdict needed
+                jsonlfile.writelines(orjson.dumps(job, option=orjson.OPT_APPEND_NEWLINE) for job in jobs)
             
-            logger.info("MongoDB storage is commented out. Install pymongo and uncomment the code to use it.")
+            logger.info("Saved %d jobs to %s", len(jobs), filename)
+        except Exception as e:
+            logger.error("Error saving to JSONL: %s", e)
+    
+    def save_to_mongodb(self, jobs: Union[JobBatch, List[JobListing]], 
+                       connection_string: str = MONGODB_CONFIG["connection_string"],
+                       database: str = MONGODB_CONFIG["database"], 
+                       collection: str = MONGODB_CONFIG["collection"],
+                       batch_size: int = 1000):
+        """
+        Save job listings to MongoDB (optional - requires pymongo)
+        
+        Jobs are upserted by link in unordered bulk writes of `batch_size`
+        operations, so each batch costs one round-trip.
+        """
+        if MongoClient is None:
+            logger.warning("pymongo is not installed, skipping MongoDB storage")
+            return
+        
+        try:
+            client = MongoClient(connection_string)
+            try:
+                coll = client[database][collection]
+                coll.create_index("link", unique=True)
+                
+                # Replace existing documents based on link as unique identifier
+                for start in range(0, len(jobs), batch_size):
+                    ops = [
+                        UpdateOne({"link": job.link}, {"$set": job.to_dict()}, upsert=True)
+                        for job in jobs[start:start + batch_size]
+                    ]
+                    coll.bulk_write(ops, ordered=False)
+                
+                logger.info("Saved %d jobs to MongoDB: %s.%s", len(jobs), database, collection)
+            finally:
+                client.close()
             
         except Exception as e:
-            logger.error(f"Error saving to MongoDB: {e}")
+            logger.error("Error saving to MongoDB: %s", e)
+
+
+class ITviecCrawler(BaseCrawler):
+    """Main crawler class for ITviec.com"""
+    
+    def __init__(self, base_url: str = "https://itviec.com",
+                 delay: float = 60.0 / CRAWLER_CONFIG.requests_per_minute,
+                 cache_path: Optional[str] = CRAWLER_CONFIG.cache_path,
+                 etag_path: Optional[str] = CRAWLER_CONFIG.etag_path):
+        site_config = replace(SITE_CONFIGS["itviec"], base_url=base_url)
+        super().__init__(site_config, delay=delay, cache_path=cache_path, etag_path=etag_path)
+
+
+class MultiSiteCrawler:
+    """Crawl several sites concurrently, each under its own rate budget"""
+    
+    def __init__(self, sites: Optional[List[str]] = None, max_concurrent_sites: int = 3):
+        self.sites = sites or list(SITE_CONFIGS)
+        self.max_concurrent_sites = max_concurrent_sites
+    
+    async def crawl_all(self, max_pages: int = 3, query: str = "") -> Dict[str, JobBatch]:
+        """
+        Crawl every configured site that has a parser
+        
+        Args:
+            max_pages: Maximum number of pages to crawl per site
+            query: Search query (optional)
+            
+        Returns:
+            Dict mapping site name to its JobBatch
+        """
+        crawlers = []
+        for site in self.sites:
+            site_config = SITE_CONFIGS.get(site)
+            if site_config is None:
+                logger.warning("Skipping %s: no site config", site)
+                continue
+            try:
+                crawlers.append(BaseCrawler(site_config))
+            except ValueError as e:
+                logger.warning("Skipping %s: %s", site, e)
+        
+        # Bounds how many sites are crawled at once; per-host pacing is
+        # handled by each crawler's own rate limiter
+        site_sem = asyncio.Semaphore(self.max_concurrent_sites)
+        
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            async def crawl_site(crawler: BaseCrawler):
+                async with site_sem:
+                    try:
+                        jobs = await crawler.crawl_jobs_async(max_pages=max_pages, query=query, executor=executor)
+                    finally:
+                        await crawler.aclose()
+                return crawler.site, jobs
+            
+            results = await asyncio.gather(*(crawl_site(crawler) for crawler in crawlers))
+        
+        return dict(results)
+    
+    def crawl(self, max_pages: int = 3, query: str = "") -> Dict[str, JobBatch]:
+        """Synchronous wrapper around crawl_all"""
+        return asyncio.run(self.crawl_all(max_pages=max_pages, query=query))
 
 
 def main():
@@ -199,8 +774,9 @@ def main():
     parser = argparse.ArgumentParser(description='ITviec Job Crawler')
     parser.add_argument('--pages', type=int, default=3, help='Number of pages to crawl (default: 3)')
     parser.add_argument('--query', type=str, default='', help='Search query (default: empty)')
-    parser.add_argument('--output', type=str, default='outputs/itviec_jobs.csv', help='Output CSV filename (default: outputs/itviec_jobs.csv)')
+    parser.add_argument('--output', type=str, default='outputs/itviec_jobs.csv', help='Output filename, .csv or .jsonl (default: outputs/itviec_jobs.csv)')
     parser.add_argument('--delay', type=float, default=1.0, help='Delay between requests in seconds (default: 1.0)')
+    parser.add_argument('--resume', action='store_true', help='Checkpoint pages to the CSV output and resume an interrupted crawl')
     
     args = parser.parse_args()
     
@@ -208,21 +784,39 @@ def main():
     crawler = ITviecCrawler(delay=args.delay)
     
     # Crawl jobs
-    logger.info(f"Starting ITviec crawler - Pages: {args.pages}, Query: '{args.query}'")
-    jobs = crawler.crawl_jobs(max_pages=args.pages, query=args.query)
+    logger.info("Starting ITviec crawler - Pages: %d, Query: '%s'", args.pages, args.query)
+    # CSV rows are streamed to the output while the crawl runs, without
+    # keeping the jobs in memory; JSONL is written from the returned jobs
+    jsonl_output = args.output.endswith('.jsonl')
+    jobs = crawler.crawl_jobs(max_pages=args.pages, query=args.query, resume=args.resume,
+                              output=None if jsonl_output else args.output,
+                              collect=jsonl_output)
     
     # Save results
-    if jobs:
-        crawler.save_to_csv(jobs, args.output)
-        logger.info(f"Crawling completed! Found {len(jobs)} jobs.")
+    if jsonl_output:
+        if jobs:
+            crawler.save_to_jsonl(jobs, args.output)
+        count = len(jobs)
+        sample = [(job.title, job.company, job.location) for job in jobs[:3]]
+    else:
+        # The jobs were not kept in memory: count and sample the rows on disk
+        count, sample = 0, []
+        with open(args.output, newline='', encoding='utf-8') as csvfile:
+            for row in csv.DictReader(csvfile):
+                if count < 3:
+                    sample.append((row['title'], row['company'], row['location']))
+                count += 1
+    
+    if count:
+        logger.info("Crawling completed! Found %d jobs.", count)
         
         # Print sample of results
-        logger.info("Sample results:")
-        for i, job in enumerate(jobs[:3]):
-            logger.info(f"  {i+1}. {job.title} at {job.company} ({job.location})")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Sample results:")
+            for i, (title, company, location) in enumerate(sample):
+                logger.info("  %d. %s at %s (%s)", i + 1, title, company, location)
     else:
         logger.warning("No jobs found!")
 
-
 if __name__ == "__main__":
     main()
@@ -6,6 +6,7 @@ Demo script showcasing Phase 1 ITviec Crawler capabilities
 import sys
 import os
 import time
+from collections import Counter
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -57,7 +58,9 @@ def demo_search_query():
         print(f"✅ Found {len(react_jobs)} React-related jobs")
         
         # Filter jobs that actually mention React
-        react_filtered = [job for job in react_jobs if 'react' in job.title.lower() or 'react' in job.skills.__str__().lower()]
+        query = 'react'
+        react_filtered = [job for job in react_jobs
+                          if query in job.title.lower() or any(query in skill.lower() for skill in job.skills)]
         print(f"   📊 {len(react_filtered)} jobs specifically mention React")
         
         if react_filtered:
@@ -112,31 +115,18 @@ def demo_data_analysis():
     jobs = crawler.crawl_jobs(max_pages=1)
     
     if jobs:
-        # Analyze skills
-        all_skills = []
-        for job in jobs:
-            all_skills.extend(job.skills)
-        
-        # Count skill frequency
-        skill_counts = {}
-        for skill in all_skills:
-            skill_counts[skill] = skill_counts.get(skill, 0) + 1
-        
-        # Top skills
-        top_skills = sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        # Top skills by frequency
+        top_skills = Counter(skill for job in jobs for skill in job.skills).most_common(10)
         
         print(f"📈 Top Skills (from {len(jobs)} jobs):")
         for i, (skill, count) in enumerate(top_skills, 1):
             print(f"   {i:2d}. {skill}: {count} jobs")
         
         # Location analysis
-        location_counts = {}
-        for job in jobs:
-            if job.location != "N/A":
-                location_counts[job.location] = location_counts.get(job.location, 0) + 1
+        location_counts = Counter(job.location for job in jobs if job.location != "N/A")
         
         print(f"\n📍 Job Locations:")
-        for location, count in sorted(location_counts.items(), key=lambda x: x[1], reverse=True):
+        for location, count in location_counts.most_common():
             print(f"   {location}: {count} jobs")
 
 
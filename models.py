@@ -0,0 +1,103 @@
+"""
+Job listing models shared by the crawler and the site parsers
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+
+
+@dataclass(slots=True)
+class JobListing:
+    """Data class for job listing information (slotted: no per-instance __dict__)"""
+    title: str
+    link: str
+    company: str
+    location: str
+    posted_date: str
+    logo_url: str
+    skills: List[str] = None
+    
+    def __post_init__(self):
+        if self.skills is None:
+            self.skills = []
+    
+    def to_dict(self) -> dict:
+        """Return the listing as a plain dict without dataclasses.asdict reflection"""
+        return {
+            'title': self.title,
+            'link': self.link,
+            'company': self.company,
+            'location': self.location,
+            'posted_date': self.posted_date,
+            'logo_url': self.logo_url,
+            'skills': list(self.skills),
+        }
+
+
+@dataclass(slots=True)
+class JobBatch:
+    """
+    Job listings stored column by column (one list per field)
+    
+    Parsers and the crawler pass pages around as batches, so a page of N
+    jobs is a handful of lists rather than N objects. Iterating or indexing
+    a batch still yields JobListing objects for existing callers.
+    """
+    titles: List[str] = field(default_factory=list)
+    links: List[str] = field(default_factory=list)
+    companies: List[str] = field(default_factory=list)
+    locations: List[str] = field(default_factory=list)
+    posted_dates: List[str] = field(default_factory=list)
+    logo_urls: List[str] = field(default_factory=list)
+    skills: List[List[str]] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.links)
+    
+    def __iter__(self) -> Iterator[JobListing]:
+        for fields in self._columns():
+            yield JobListing(*fields)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [JobListing(*fields) for fields in zip(
+                self.titles[index], self.links[index], self.companies[index],
+                self.locations[index], self.posted_dates[index],
+                self.logo_urls[index], self.skills[index])]
+        return JobListing(self.titles[index], self.links[index], self.companies[index],
+                          self.locations[index], self.posted_dates[index],
+                          self.logo_urls[index], self.skills[index])
+    
+    def _columns(self):
+        return zip(self.titles, self.links, self.companies, self.locations,
+                   self.posted_dates, self.logo_urls, self.skills)
+    
+    def append(self, title: str, link: str, company: str, location: str,
+               posted_date: str, logo_url: str, skills: List[str]):
+        """Add one job's fields"""
+        self.titles.append(title)
+        self.links.append(link)
+        self.companies.append(company)
+        self.locations.append(location)
+        self.posted_dates.append(posted_date)
+        self.logo_urls.append(logo_url)
+        self.skills.append(skills)
+    
+    def extend(self, other: 'JobBatch', seen: Optional[set] = None):
+        """Add the jobs of another batch, skipping links already in `seen` (which is updated)"""
+        for fields in other._columns():
+            if seen is not None:
+                if fields[1] in seen:
+                    continue
+                seen.add(fields[1])
+            self.append(*fields)
+    
+    def clear(self):
+        for column in (self.titles, self.links, self.companies, self.locations,
+                       self.posted_dates, self.logo_urls, self.skills):
+            column.clear()
+    
+    def rows(self):
+        """Yield CSV rows as plain tuples in CSV_FIELDNAMES order"""
+        for title, link, company, location, posted_date, logo_url, skills in self._columns():
+            yield (title, link, company, location, posted_date, logo_url, ', '.join(skills))
@@ -2,6 +2,6 @@
 Parsers module for different job sites
 """
 
-from .itviec import ITviecParser
+from .itviec import ITviecParser, parse_jobs as parse_itviec_jobs
 
-__all__ = ['ITviecParser']
+__all__ = ['ITviecParser', 'parse_itviec_jobs']
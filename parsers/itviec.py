@@ -4,12 +4,226 @@ ITviec Parser - Extract job listings from ITviec.com
 
 import re
 import logging
-from typing import List
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Pattern, Tuple
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer, Tag
+
+from models import JobBatch
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional, fall back to lxml
+    LexborHTMLParser = None
+
+try:
+    import lxml.html
+    from cssselect import HTMLTranslator
+    from lxml import etree
+except ImportError:  # fall back to BeautifulSoup's pure-Python parser
+    lxml = None
 
 logger = logging.getLogger(__name__)
 
+# Text patterns, compiled once at import. Location and date patterns are
+# tried in list order, which decides the winner when several match.
+_JOB_KEYWORD_RE = re.compile(r'developer|engineer|manager|analyst|designer', re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+# Leading bullet point or [Image: ...] placeholder (DOTALL: placeholders may wrap lines)
+_CLEAN_RE = re.compile(r'^\s*[\u2022\u2023\u25E6\u2043\u2219]\s*|\s*\[Image:.*?\]\s*', re.DOTALL)
+_LOCATION_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'Ho Chi Minh',
+    r'Ha Noi',
+    r'Da Nang',
+    r'Can Tho',
+    r'Hybrid',
+    r'Remote',
+    r'At office'
+])
+_DATE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'Posted \d+ \w+ ago',
+    r'\d+ hours? ago',
+    r'\d+ minutes? ago',
+    r'\d+ days? ago',
+    r'HOT Posted \d+ \w+ ago',
+    r'SUPER HOT Posted \d+ \w+ ago'
+])
+MAX_SKILLS = 20  # skills kept per job
+COMMON_SKILLS = [
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'ReactJS', 'VueJS', 'Angular',
+    'NodeJS', 'PHP', 'C#', 'C++', 'Go', 'Rust', 'Swift', 'Kotlin',
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'MongoDB', 'PostgreSQL',
+    'MySQL', 'Redis', 'Git', 'Jenkins', 'CI/CD', 'Agile', 'Scrum'
+]
+# One scan finds every skill; longer names are tried first at each position
+_SKILLS_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(skill) for skill in sorted(COMMON_SKILLS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+_SKILL_NAMES = {skill.lower(): skill for skill in COMMON_SKILLS}
+
+
+class _Node:
+    """Thin adapter exposing the subset of the bs4 Tag API used by ITviecParser on a selectolax node"""
+    
+    __slots__ = ('node',)
+    
+    def __init__(self, node):
+        self.node = node
+    
+    @property
+    def name(self) -> str:
+        return self.node.tag
+    
+    @property
+    def key(self) -> int:
+        return self.node.mem_id
+    
+    @property
+    def parents(self):
+        node = self.node.parent
+        while node is not None:
+            yield _Node(node)
+            node = node.parent
+    
+    @property
+    def descendants(self):
+        # Node.traverse() runs past the end of this subtree, so walk children explicitly
+        stack = list(self.node.iter())[::-1]
+        while stack:
+            node = stack.pop()
+            yield _Node(node)
+            stack.extend(list(node.iter())[::-1])
+    
+    def get(self, attr: str, default: str = '') -> str:
+        value = self.node.attributes.get(attr)
+        return default if value is None else value
+    
+    def get_text(self) -> str:
+        return self.node.text(deep=True)
+    
+    def select(self, selector: str) -> List['_Node']:
+        # css() can match this node itself; bs4's select() only searches descendants
+        own_id = self.node.mem_id
+        return [_Node(node) for node in self.node.css(selector) if node.mem_id != own_id]
+    
+    def select_one(self, selector: str) -> Optional['_Node']:
+        node = self.node.css_first(selector)
+        if node is not None and node.mem_id == self.node.mem_id:
+            found = self.select(selector)
+            return found[0] if found else None
+        return _Node(node) if node is not None else None
+    
+    def find(self, name: str, href: bool = False) -> Optional['_Node']:
+        return self.select_one(f'{name}[href]' if href else name)
+    
+    def find_all(self, name, href: bool = False) -> List['_Node']:
+        if isinstance(name, str):
+            return self.select(f'{name}[href]' if href else name)
+        # Grouped selectors are not returned in document order, so walk the tree
+        names = set(name)
+        return [node for node in self.descendants
+                if node.name in names and (not href or node.node.attributes.get('href') is not None)]
+    
+    def find_parent(self, name: str) -> Optional['_Node']:
+        node = self.node.parent
+        while node is not None:
+            if node.tag == name:
+                return _Node(node)
+            node = node.parent
+        return None
+
+
+class _LxmlNode:
+    """Same adapter as _Node over an lxml.html element, with selectors compiled to XPath once per process"""
+    
+    __slots__ = ('el',)
+    
+    _xpaths = {}
+    
+    def __init__(self, el):
+        self.el = el
+    
+    @classmethod
+    def _xpath(cls, selector: str):
+        xpath = cls._xpaths.get(selector)
+        if xpath is None:
+            # descendant:: rather than cssselect's descendant-or-self::, to match bs4's select()
+            xpath = etree.XPath(HTMLTranslator().css_to_xpath(selector, prefix='descendant::'))
+            cls._xpaths[selector] = xpath
+        return xpath
+    
+    @property
+    def key(self):
+        # lxml keeps one proxy per live element, and the set holding this key keeps it alive
+        return self.el
+    
+    @property
+    def name(self) -> str:
+        return self.el.tag
+    
+    @property
+    def parents(self):
+        for el in self.el.iterancestors():
+            yield _LxmlNode(el)
+    
+    def get(self, attr: str, default: str = '') -> str:
+        return self.el.get(attr, default)
+    
+    def get_text(self) -> str:
+        return self.el.text_content()
+    
+    def select(self, selector: str) -> List['_LxmlNode']:
+        return [_LxmlNode(el) for el in self._xpath(selector)(self.el)]
+    
+    def select_one(self, selector: str) -> Optional['_LxmlNode']:
+        found = self._xpath(selector)(self.el)
+        return _LxmlNode(found[0]) if found else None
+    
+    def find(self, name: str, href: bool = False) -> Optional['_LxmlNode']:
+        return next(iter(self.find_all(name, href)), None)
+    
+    def find_all(self, name, href: bool = False) -> List['_LxmlNode']:
+        names = [name] if isinstance(name, str) else name
+        return [_LxmlNode(el) for el in self.el.iterdescendants(*names)
+                if not href or el.get('href') is not None]
+    
+    def find_parent(self, name: str) -> Optional['_LxmlNode']:
+        el = next(self.el.iterancestors(name), None)
+        return _LxmlNode(el) if el is not None else None
+
+
+def _is_known_city(text: str) -> bool:
+    """Common location patterns in Vietnam"""
+    text = text.lower()
+    return any(city in text for city in ['ho chi minh', 'ha noi', 'da nang', 'can tho'])
+
+
+def _is_posted_date(text: str) -> bool:
+    """Text that reads like a relative posting date"""
+    text = text.lower()
+    return any(pattern in text for pattern in ['posted', 'ago', 'hour', 'minute', 'day', 'week'])
+
+
+@dataclass(frozen=True, slots=True)
+class _FieldRule:
+    """How to extract a text field: selectors in order, an acceptance check, then text patterns"""
+    selectors: List[str]
+    accept: Callable[[str], bool]
+    patterns: Tuple[Pattern, ...]
+    # Keep the last non-accepted selector match instead of falling back to the patterns
+    keep_unaccepted: bool = False
+
+
+def _maybe_join(base_url: str, href: str) -> str:
+    """Resolve href against base_url, skipping urljoin for links that are already absolute"""
+    return href if href.startswith(('http://', 'https://')) else urljoin(base_url, href)
+
+
+def _node_key(node):
+    """Identity of a tree node (bs4 Tags compare equal by content, not identity)"""
+    return node.key if isinstance(node, (_Node, _LxmlNode)) else id(node)
+
 
 class ITviecParser:
     """Parser for ITviec.com job listings"""
@@ -35,8 +249,28 @@ class ITviecParser:
             # Skills selectors
             'skills': '[class*="skill"], .skills a, .tag, [class*="tag"]'
         }
+        # Split the comma-separated fallbacks once instead of per container
+        self.selector_lists = {
+            key: [selector.strip() for selector in selectors.split(', ')]
+            for key, selectors in self.job_selectors.items()
+        }
+        # Selector-then-pattern rules for the plain text fields
+        self.field_rules = {
+            # Any location element will do, but one naming a known city wins
+            'location': _FieldRule(self.selector_lists['location'], _is_known_city, _LOCATION_RES,
+                                   keep_unaccepted=True),
+            'posted_date': _FieldRule(self.selector_lists['date'], _is_posted_date, _DATE_RES),
+        }
+        # Limits the BeautifulSoup backend to the job cards matched by 'job_container'
+        self.job_strainer = SoupStrainer('div', attrs={'data-search-id': True})
+        self.company_patterns = [
+            'a[href*="/companies/"]',  # ITviec company links
+            '[class*="company"] a',
+            '.company-name a',
+            '.employer a'
+        ]
     
-    def parse_jobs(self, html_content: str, base_url: str) -> List:
+    def parse_jobs(self, html_content: str, base_url: str) -> JobBatch:
         """
         Parse job listings from ITviec HTML content
         
@@ -45,33 +279,64 @@ class ITviecParser:
             base_url: Base URL for resolving relative links
             
         Returns:
-            List of JobListing objects
+            JobBatch holding the page's jobs column by column
         """
-        from crawler import JobListing  # Import here to avoid circular import
-        
-        soup = BeautifulSoup(html_content, 'html.parser')
-        jobs = []
+        # selectolax's Lexbor parser is fastest, then raw lxml; both are much
+        # faster than BeautifulSoup and expose the same select/get_text API
+        # to the extractors below
+        strained = False
+        if LexborHTMLParser is not None:
+            soup = _Node(LexborHTMLParser(html_content).root)
+        elif lxml is not None:
+            soup = _LxmlNode(lxml.html.document_fromstring(html_content))
+        else:
+            # Build Tag objects for the job cards only, not the whole page
+            soup = self._make_soup(html_content, parse_only=self.job_strainer)
+            strained = True
         
         # Find job containers using multiple selectors
         job_containers = self._find_job_containers(soup)
+        if not job_containers and strained:
+            # No card matched the strainer (layout change): parse the full page
+            soup = self._make_soup(html_content)
+            job_containers = self._find_job_containers(soup)
+            strained = False
         
         if not job_containers:
             logger.warning("No job containers found on page")
-            return jobs
+            return JobBatch()
         
-        logger.info(f"Found {len(job_containers)} job containers")
+        logger.info("Found %d job containers", len(job_containers))
+        jobs = self._parse_containers(job_containers, base_url)
+        if strained and len(jobs) < len(job_containers):
+            # The strainer drops everything outside the cards, including a
+            # link that wraps a card: parse the full page so no card loses it
+            soup = self._make_soup(html_content)
+            jobs = self._parse_containers(self._find_job_containers(soup), base_url)
         
+        return jobs
+    
+    def _parse_containers(self, job_containers: List[Tag], base_url: str) -> JobBatch:
+        """Parse job containers into a JobBatch, skipping those without a title and link"""
+        jobs = JobBatch()
         for container in job_containers:
             try:
-                job = self._parse_single_job(container, base_url)
-                if job and job.title and job.link:  # Only add if we have essential fields
-                    jobs.append(job)
+                fields = self._parse_single_job(container, base_url)
+                if fields[0] and fields[1]:  # Only add if we have essential fields (title, link)
+                    jobs.append(*fields)
             except Exception as e:
-                logger.warning(f"Error parsing job container: {e}")
+                logger.warning("Error parsing job container: %s", e)
                 continue
         
         return jobs
     
+    def _make_soup(self, html_content: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Build a BeautifulSoup tree, preferring the C-backed lxml parser"""
+        try:
+            return BeautifulSoup(html_content, 'lxml', parse_only=parse_only)
+        except FeatureNotFound:
+            return BeautifulSoup(html_content, 'html.parser', parse_only=parse_only)
+    
     def _find_job_containers(self, soup: BeautifulSoup) -> List[Tag]:
         """Find job listing containers using multiple selector strategies"""
         
@@ -81,10 +346,10 @@ class ITviecParser:
             return containers
         
         # Try alternative selectors
-        for selector in self.job_selectors['job_container_alt'].split(', '):
-            containers = soup.select(selector.strip())
+        for selector in self.selector_lists['job_container_alt']:
+            containers = soup.select(selector)
             if containers:
-                logger.info(f"Found containers using selector: {selector}")
+                logger.info("Found containers using selector: %s", selector)
                 return containers
         
         # If specific selectors fail, try to find job patterns by content
@@ -92,96 +357,97 @@ class ITviecParser:
         containers = []
         for element in soup.find_all(['div', 'article', 'section']):
             # Check if element contains job-like content
-            text_content = element.get_text().lower()
-            if any(keyword in text_content for keyword in ['developer', 'engineer', 'manager', 'analyst', 'designer']):
-                # Check if it has a link that looks like a job
-                job_link = element.find('a', href=True)
-                if job_link and any(pattern in job_link.get('href', '') for pattern in ['/it-jobs/', '/jobs/', 'job']):
-                    containers.append(element)
-        
-        # Remove duplicates and nested containers
+            if not _JOB_KEYWORD_RE.search(element.get_text()):
+                continue
+            # Check if it has a link that looks like a job ('job' also covers /jobs/ and /it-jobs/)
+            job_link = element.find('a', href=True)
+            if job_link and 'job' in job_link.get('href', ''):
+                containers.append(element)
+        
+        # Remove duplicates and nested containers. Candidates come in document
+        # order, so a nested one always follows the container it sits in and
+        # only its ancestors need checking.
         unique_containers = []
+        accepted = set()
         for container in containers:
-            is_nested = any(container in parent.descendants for parent in unique_containers)
-            if not is_nested:
-                unique_containers.append(container)
+            if any(_node_key(parent) in accepted for parent in container.parents):
+                continue
+            accepted.add(_node_key(container))
+            unique_containers.append(container)
         
         return unique_containers[:20]  # Limit to reasonable number
     
     def _parse_single_job(self, container: Tag, base_url: str):
-        """Parse a single job container into a JobListing object"""
-        from crawler import JobListing  # Import here to avoid circular import
+        """Parse a single job container into a tuple of JobListing fields, in declaration order"""
         
         # Extract title and link
-        title, link = self._extract_title_and_link(container, base_url)
+        # Links and images are collected once and shared by the extractors
+        anchors = container.select('a[href]')
+        images = container.select('img')
+        
+        title, link = self._extract_title_and_link(container, base_url, anchors)
         
         # Extract company
-        company = self._extract_company(container)
+        company = self._extract_company(container, anchors)
         
-        # Extract location
-        location = self._extract_location(container)
+        # Text snapshot shared by the extractors' text-pattern fallbacks
+        text_content = container.get_text()
         
-        # Extract posted date
-        posted_date = self._extract_posted_date(container)
+        # Extract location and posted date
+        location = self._extract_field(container, text_content, self.field_rules['location'])
+        posted_date = self._extract_field(container, text_content, self.field_rules['posted_date'])
         
         # Extract logo URL
-        logo_url = self._extract_logo_url(container, base_url)
+        logo_url = self._extract_logo_url(container, base_url, images)
         
         # Extract skills
-        skills = self._extract_skills(container)
-        
-        return JobListing(
-            title=title or "N/A",
-            link=link or "",
-            company=company or "N/A",
-            location=location or "N/A", 
-            posted_date=posted_date or "N/A",
-            logo_url=logo_url or "",
-            skills=skills
+        skills = self._extract_skills(container, text_content)
+        
+        return (
+            title or "N/A",
+            link or "",
+            company or "N/A",
+            location or "N/A",
+            posted_date or "N/A",
+            logo_url or "",
+            skills
         )
     
-    def _extract_title_and_link(self, container: Tag, base_url: str):
+    def _extract_title_and_link(self, container: Tag, base_url: str, anchors: List[Tag]):
         """Extract job title and link"""
         title, link = "", ""
         
         # Try title selectors
-        for selector in self.job_selectors['title'].split(', '):
-            title_element = container.select_one(selector.strip())
+        for selector in self.selector_lists['title']:
+            title_element = container.select_one(selector)
             if title_element:
                 title = self._clean_text(title_element.get_text())
                 link = title_element.get('href', '')
                 if link:
-                    link = urljoin(base_url, link)
+                    link = _maybe_join(base_url, link)
                 break
         
         # If no link found in title, try alternative approach
         if not link:
-            for selector in self.job_selectors['title_alt'].split(', '):
-                title_element = container.select_one(selector.strip())
+            for selector in self.selector_lists['title_alt']:
+                title_element = container.select_one(selector)
                 if title_element:
                     if not title:
                         title = self._clean_text(title_element.get_text())
                     # Look for nearest link
-                    link_element = title_element.find('a') or title_element.find_parent('a') or container.find('a', href=True)
+                    link_element = title_element.find('a') or title_element.find_parent('a') or (anchors[0] if anchors else None)
                     if link_element:
-                        link = urljoin(base_url, link_element.get('href', ''))
+                        link = _maybe_join(base_url, link_element.get('href', ''))
                     break
         
         return title, link
     
-    def _extract_company(self, container: Tag):
+    def _extract_company(self, container: Tag, anchors: List[Tag]):
         """Extract company name"""
         company = ""
         
         # Try specific ITviec patterns first
-        company_patterns = [
-            'a[href*="/companies/"]',  # ITviec company links
-            '[class*="company"] a',
-            '.company-name a',
-            '.employer a'
-        ]
-        
-        for pattern in company_patterns:
+        for pattern in self.company_patterns:
             company_element = container.select_one(pattern)
             if company_element:
                 company_text = self._clean_text(company_element.get_text())
@@ -193,8 +459,8 @@ class ITviecParser:
         
         # Try alternative selectors
         if not company:
-            for selector in self.job_selectors['company_alt'].split(', '):
-                company_element = container.select_one(selector.strip())
+            for selector in self.selector_lists['company_alt']:
+                company_element = container.select_one(selector)
                 if company_element:
                     company_text = self._clean_text(company_element.get_text())
                     if company_text and len(company_text) < 100:
@@ -203,150 +469,106 @@ class ITviecParser:
         
         # If still no company, try to extract from link text patterns
         if not company:
-            links = container.find_all('a', href=True)
-            for link in links:
-                if hasattr(link, 'get'):
-                    href = link.get('href', '') or ''
-                    if '/companies/' in str(href):
-                        company_text = self._clean_text(link.get_text())
-                        if company_text and len(company_text) < 100 and not any(word in company_text.lower() 
-                            for word in ['view', 'jobs', 'sign in', 'salary', 'image']):
-                            company = company_text
-                            break
-        
-        return company
-    
-    def _extract_location(self, container: Tag):
-        """Extract job location"""
-        location = ""
-        
-        for selector in self.job_selectors['location'].split(', '):
-            location_element = container.select_one(selector.strip())
-            if location_element:
-                location = self._clean_text(location_element.get_text())
-                # Common location patterns in Vietnam
-                if any(city in location.lower() for city in ['ho chi minh', 'ha noi', 'da nang', 'can tho']):
-                    break
-        
-        # If no specific location found, look for text patterns
-        if not location:
-            text_content = container.get_text()
-            location_patterns = [
-                r'Ho Chi Minh',
-                r'Ha Noi',
-                r'Da Nang', 
-                r'Can Tho',
-                r'Hybrid',
-                r'Remote',
-                r'At office'
-            ]
-            
-            for pattern in location_patterns:
-                match = re.search(pattern, text_content, re.IGNORECASE)
-                if match:
-                    location = match.group()
+            company_links = [link for link in anchors if '/companies/' in (link.get('href', '') or '')]
+            for link in company_links:
+                company_text = self._clean_text(link.get_text())
+                if company_text and len(company_text) < 100 and not any(word in company_text.lower() 
+                    for word in ['view', 'jobs', 'sign in', 'salary', 'image']):
+                    company = company_text
                     break
         
-        return location
+        return company
     
-    def _extract_posted_date(self, container: Tag):
-        """Extract posted date"""
-        posted_date = ""
-        
-        for selector in self.job_selectors['date'].split(', '):
-            date_element = container.select_one(selector.strip())
-            if date_element:
-                date_text = self._clean_text(date_element.get_text())
-                # Look for date patterns
-                if any(pattern in date_text.lower() for pattern in ['posted', 'ago', 'hour', 'minute', 'day', 'week']):
-                    posted_date = date_text
-                    break
-        
-        # Look for date patterns in the entire container text
-        if not posted_date:
-            text_content = container.get_text()
-            date_patterns = [
-                r'Posted \d+ \w+ ago',
-                r'\d+ hours? ago',
-                r'\d+ minutes? ago', 
-                r'\d+ days? ago',
-                r'HOT Posted \d+ \w+ ago',
-                r'SUPER HOT Posted \d+ \w+ ago'
-            ]
-            
-            for pattern in date_patterns:
-                match = re.search(pattern, text_content, re.IGNORECASE)
+    def _extract_field(self, container: Tag, text_content: str, rule: '_FieldRule') -> str:
+        """Extract one text field: try the rule's selectors, then its patterns on the container text"""
+        value = ""
+        
+        for selector in rule.selectors:
+            element = container.select_one(selector)
+            if element:
+                text = self._clean_text(element.get_text())
+                if rule.accept(text):
+                    return text
+                if rule.keep_unaccepted:
+                    value = text
+        
+        # If nothing usable was found, look for text patterns
+        if not value:
+            for pattern in rule.patterns:
+                match = pattern.search(text_content)
                 if match:
-                    posted_date = match.group()
-                    break
+                    return match.group()
         
-        return posted_date
+        return value
     
-    def _extract_logo_url(self, container: Tag, base_url: str):
+    def _extract_logo_url(self, container: Tag, base_url: str, images: List[Tag]):
         """Extract company logo URL"""
         logo_url = ""
         
-        for selector in self.job_selectors['logo'].split(', '):
-            logo_element = container.select_one(selector.strip())
+        for selector in self.selector_lists['logo']:
+            logo_element = container.select_one(selector)
             if logo_element and hasattr(logo_element, 'get'):
                 src = logo_element.get('src', '')
                 if src:
-                    logo_url = urljoin(base_url, str(src))
+                    logo_url = _maybe_join(base_url, str(src))
                     break
         
         # Alternative: look for any image that might be a logo
         if not logo_url:
-            images = container.find_all('img')
             for img in images:
-                if hasattr(img, 'get') and hasattr(img, 'name') and img.name == 'img':
-                    src = img.get('src', '')
-                    alt = img.get('alt', '') or ''
-                    alt_str = str(alt).lower() if alt else ''
-                    src_str = str(src).lower() if src else ''
-                    
-                    if src and ('logo' in src_str or 'logo' in alt_str or 'company' in alt_str):
-                        logo_url = urljoin(base_url, str(src))
-                        break
+                src = img.get('src', '') or ''
+                alt = (img.get('alt', '') or '').lower()
+                if src and ('logo' in src.lower() or 'logo' in alt or 'company' in alt):
+                    logo_url = _maybe_join(base_url, src)
+                    break
         
         return logo_url
     
-    def _extract_skills(self, container: Tag):
-        """Extract skills/technologies mentioned"""
-        skills = []
+    def _extract_skills(self, container: Tag, text_content: str):
+        """Extract skills/technologies mentioned (first MAX_SKILLS distinct, in page order)"""
+        # dict keys dedupe while keeping the order skills were found in
+        skills = {}
         
-        for selector in self.job_selectors['skills'].split(', '):
-            skill_elements = container.select(selector.strip())
+        for selector in self.selector_lists['skills']:
+            skill_elements = container.select(selector)
             for element in skill_elements:
                 skill_text = self._clean_text(element.get_text())
                 if skill_text and len(skill_text) < 50:  # Reasonable skill name length
-                    skills.append(skill_text)
+                    skills[skill_text] = None
+                    if len(skills) >= MAX_SKILLS:
+                        return list(skills)
         
         # Look for common tech skills in text
         if not skills:
-            text_content = container.get_text()
-            common_skills = [
-                'Python', 'Java', 'JavaScript', 'TypeScript', 'ReactJS', 'VueJS', 'Angular',
-                'NodeJS', 'PHP', 'C#', 'C++', 'Go', 'Rust', 'Swift', 'Kotlin',
-                'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'MongoDB', 'PostgreSQL',
-                'MySQL', 'Redis', 'Git', 'Jenkins', 'CI/CD', 'Agile', 'Scrum'
-            ]
-            
-            for skill in common_skills:
-                if re.search(r'\b' + re.escape(skill) + r'\b', text_content, re.IGNORECASE):
-                    skills.append(skill)
+            for match in _SKILLS_RE.finditer(text_content):
+                skills[_SKILL_NAMES[match.group().lower()]] = None
+                if len(skills) >= MAX_SKILLS:
+                    break
         
-        return list(set(skills))  # Remove duplicates
+        return list(skills)
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text content"""
         if not text:
             return ""
         
-        # Remove extra whitespace and normalize
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        # Remove common unwanted patterns
-        text = re.sub(r'^\s*[\u2022\u2023\u25E6\u2043\u2219]\s*', '', text)  # Remove bullet points
-        text = re.sub(r'\s*\[Image:.*?\]\s*', '', text)  # Remove [Image: ...] patterns
-        
-        return text
+        # Remove bullet points and [Image: ...] patterns in one pass, then
+        # normalize whitespace
+        return _WS_RE.sub(' ', _CLEAN_RE.sub('', text)).strip()
+
+
+# One parser per process, built on first use by parse_jobs()
+_parser: Optional[ITviecParser] = None
+
+
+def parse_jobs(html_content: str, base_url: str) -> JobBatch:
+    """
+    Parse one ITviec page with this process's shared ITviecParser
+    
+    Module-level so it pickles by reference and can be submitted to a
+    process pool; each worker builds its parser once and reuses it.
+    """
+    global _parser
+    if _parser is None:
+        _parser = ITviecParser()
+    return _parser.parse_jobs(html_content, base_url)
@@ -4,29 +4,94 @@ Test script for ITviec crawler
 Run this to test the crawler functionality
 """
 
+import asyncio
 import sys
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
 
 # Add current directory to path so we can import our modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from crawler import ITviecCrawler, JobListing
+from parsers import itviec
+
+# Job cards whose own class matches extractor selectors ([class*="tag"],
+# [class*="location"]); only elements inside a card may be picked up. The
+# last card's link wraps the card instead of sitting inside it.
+SAMPLE_HTML = """
+<html><body>
+<div class="job-card tag-list" data-search-id="1">
+  <h3><a href="/it-jobs/z-dev">Z dev</a></h3>
+  <span class="tag">Go</span><span class="tag">Rust</span>
+</div>
+<div class="location-ha-noi" data-search-id="2">
+  <h3><a href="/it-jobs/y-dev">Y dev</a></h3>
+  <span class="city">Da Nang</span>
+</div>
+<a href="/it-jobs/x-dev"><div data-search-id="3"><h3>X dev</h3></div></a>
+</body></html>
+"""
+SAMPLE_EXPECTED = [
+    ("Z dev", "N/A", ["Go", "Rust"]),
+    ("Y dev", "Da Nang", []),
+    ("X dev", "N/A", []),
+]
+
+
+def test_parser_sample() -> bool:
+    """Parse SAMPLE_HTML offline with every available parser backend"""
+    print("🧪 Checking parser backends on an offline sample...")
+    backends = {
+        "selectolax": {},
+        "lxml": {"LexborHTMLParser": None},
+        "BeautifulSoup": {"LexborHTMLParser": None, "lxml": None},
+    }
+    ok = True
+    for backend, disabled in backends.items():
+        with mock.patch.dict(itviec.__dict__, disabled):
+            jobs = itviec.ITviecParser().parse_jobs(SAMPLE_HTML, "https://itviec.com")
+        got = [(job.title, job.location, job.skills) for job in jobs]
+        if got == SAMPLE_EXPECTED:
+            print(f"   ✅ {backend}")
+        else:
+            ok = False
+            print(f"   ❌ {backend}: {got}")
+    return ok
+
+
+async def crawl_concurrently(crawler: ITviecCrawler, max_pages: int, concurrency: int):
+    """Fetch pages concurrently and parse them in a process pool"""
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        try:
+            return await crawler.crawl_jobs_async(max_pages=max_pages, concurrency=concurrency,
+                                                  executor=executor)
+        finally:
+            await crawler.aclose()
 
 
-def test_crawler():
+def test_crawler(max_pages: int = 1, concurrency: int = 5, delay: float = 2.0):
     """Test the crawler with a small number of pages"""
     print("🕷️  Testing ITviec Crawler")
     print("=" * 50)
     
-    # Initialize crawler
-    crawler = ITviecCrawler(delay=2.0)  # Be polite with 2-second delay
+    # Initialize crawler; be polite with a 2-second delay by default. The HTTP
+    # cache and ETag sidecar are off so every page is really fetched and parsed.
+    crawler = ITviecCrawler(delay=delay, cache_path=None, etag_path=None)
     
-    # Test with just 1 page first
-    print("🔍 Crawling 1 page from ITviec...")
-    jobs = crawler.crawl_jobs(max_pages=1)
+    # Test with a small number of pages (1 by default, pass a count to bench more)
+    print(f"🔍 Crawling {max_pages} page(s) from ITviec...")
+    start = time.perf_counter()
+    jobs = asyncio.run(crawl_concurrently(crawler, max_pages, concurrency))
+    elapsed = time.perf_counter() - start
     
     if jobs:
-        print(f"✅ Successfully found {len(jobs)} jobs!")
+        print(f"✅ Successfully found {len(jobs)} jobs in {elapsed:.1f}s!")
+        if max_pages > 1:
+            # Requests are paced by the rate limiter, so this is a floor on the
+            # elapsed time whatever the concurrency
+            print(f"   (at least {(max_pages - 1) * delay:.1f}s of that is the {delay}s rate limit)")
         print("\n📋 Sample job listings:")
         print("-" * 30)
         
@@ -53,4 +118,8 @@ def test_crawler():
 
 
 if __name__ == "__main__":
-    test_crawler()
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    if not test_parser_sample():
+        sys.exit(1)
+    test_crawler(max_pages=pages, delay=delay)